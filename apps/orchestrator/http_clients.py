@@ -0,0 +1,76 @@
+"""
+Shared HTTP clients for the orchestrator.
+
+A single keep-alive connection pool to the NestJS API avoids paying a fresh
+TCP+TLS handshake for every backend call.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from typing import Optional
+
+import httpx
+
+NEST_API_URL = os.getenv("NEST_API_URL", "http://localhost:3000")
+SERVICE_EMAIL = os.getenv("ORCH_SERVICE_EMAIL", "admin@insurance.com")
+SERVICE_PASSWORD = os.getenv("ORCH_SERVICE_PASSWORD", "admin123")
+# Conservative TTL below the NestJS JWT's 1h expiry
+SERVICE_TOKEN_TTL = float(os.getenv("ORCH_SERVICE_TOKEN_TTL", str(55 * 60)))
+
+_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+_nest_client: Optional[httpx.AsyncClient] = None
+
+
+def get_nest_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient for the NestJS API, creating it lazily."""
+    global _nest_client
+    if _nest_client is None or _nest_client.is_closed:
+        _nest_client = httpx.AsyncClient(
+            base_url=NEST_API_URL,
+            limits=_LIMITS,
+            timeout=httpx.Timeout(10.0),
+        )
+    return _nest_client
+
+
+async def close_nest_client() -> None:
+    """Close the shared client (called from the FastAPI shutdown hook)."""
+    global _nest_client
+    if _nest_client is not None and not _nest_client.is_closed:
+        await _nest_client.aclose()
+    _nest_client = None
+
+
+_token: Optional[tuple[str, float]] = None  # (access_token, expiry epoch)
+_token_lock = asyncio.Lock()
+
+
+async def get_service_token() -> str:
+    """Return a cached NestJS service token, re-logging in only on expiry.
+
+    Double-checked locking so concurrent callers don't stampede /auth/login.
+    """
+    global _token
+    if _token is not None and time.time() < _token[1]:
+        return _token[0]
+    async with _token_lock:
+        if _token is not None and time.time() < _token[1]:
+            return _token[0]
+        client = get_nest_client()
+        resp = await client.post(
+            "/auth/login",
+            json={"email": SERVICE_EMAIL, "password": SERVICE_PASSWORD},
+        )
+        resp.raise_for_status()
+        token = resp.json().get("access_token", "")
+        _token = (token, time.time() + SERVICE_TOKEN_TTL)
+        return token
+
+
+def invalidate_service_token() -> None:
+    """Drop the cached token (e.g. after a 401 from the API)."""
+    global _token
+    _token = None
@@ -19,10 +19,6 @@ def setup_phoenix_tracing() -> Optional[object]:
     Returns:
         Tracer provider if successful, None if disabled or failed
     """
-    if not PHOENIX_ENABLED:
-        print("🔍 Phoenix tracing is disabled. Set PHOENIX_ENABLED=true to enable.")
-        return None
-    
     try:
         print(f"🔍 Setting up Phoenix tracing for project: {PHOENIX_PROJECT_NAME}")
         
@@ -66,9 +62,6 @@ def log_agent_interaction(session_id: str, agent_name: str, user_message: str, r
     
     This adds extra metadata that can be useful for analysis in Phoenix
     """
-    if not PHOENIX_ENABLED:
-        return
-        
     try:
         # You can add custom spans or attributes here
         # This is useful for adding business context to your traces
@@ -77,3 +70,16 @@ def log_agent_interaction(session_id: str, agent_name: str, user_message: str, r
         
     except Exception as e:
         print(f"❌ Error logging agent interaction: {e}")
+
+
+if not PHOENIX_ENABLED:
+    # Rebind the public entry points to no-ops at import time so the
+    # disabled path costs callers nothing per turn beyond a function call
+    def setup_phoenix_tracing() -> Optional[object]:  # noqa: F811
+        """Phoenix disabled: nothing to set up."""
+        print("🔍 Phoenix tracing is disabled. Set PHOENIX_ENABLED=true to enable.")
+        return None
+
+    def log_agent_interaction(session_id: str, agent_name: str, user_message: str, response: str):  # noqa: F811
+        """Phoenix disabled: no-op."""
+        return None
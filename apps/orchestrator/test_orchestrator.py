@@ -5,15 +5,19 @@ Test script for the OpenAI agent orchestrator
 
 import asyncio
 import os
-from openai_agent import run_turn_sync
+from openai_agent import AppContext, get_session, run_turn
 
 # Set environment variables for testing
 os.environ["OPENAI_API_KEY"] = "your-api-key-here"  # Replace with actual key
 os.environ["NEST_API_URL"] = "http://localhost:3000"
 
-def test_basic_queries():
-    """Test basic queries to the orchestrator"""
-    
+async def _run_case(query: str, session_id: str):
+    """Run one query on its own session (keeps per-test isolation)."""
+    return await run_turn(query, get_session(session_id), AppContext(user_role="user"))
+
+async def test_basic_queries():
+    """Test basic queries to the orchestrator, all in flight at once"""
+
     test_cases = [
         "What are my policy details for USER-001?",
         "Check claim status 98765",
@@ -21,34 +25,33 @@ def test_basic_queries():
         "Tell me about available insurance policies",
         "How do I submit a claim?"
     ]
-    
+
     print("Testing OpenAI Agent Orchestrator")
     print("=" * 50)
-    
-    for i, query in enumerate(test_cases, 1):
+
+    # Each case is a network round trip; running them concurrently makes the
+    # whole suite cost roughly the slowest single case
+    results = await asyncio.gather(
+        *(_run_case(query, f"test-session-{i}") for i, query in enumerate(test_cases, 1)),
+        return_exceptions=True,
+    )
+
+    for i, (query, result) in enumerate(zip(test_cases, results), 1):
         print(f"\nTest {i}: {query}")
         print("-" * 30)
-        
-        try:
-            # Test with a unique session ID
-            session_id = f"test-session-{i}"
-            result = run_turn_sync(query, session_id, "user")
-            
-            if isinstance(result, str):
-                print(f"Response: {result}")
-            elif isinstance(result, dict):
-                print(f"Response: {result}")
-            else:
-                print(f"Unexpected response type: {type(result)}")
-                
-        except Exception as e:
-            print(f"Error: {e}")
-        
+
+        if isinstance(result, BaseException):
+            print(f"Error: {result}")
+        elif isinstance(result, (str, dict)):
+            print(f"Response: {result}")
+        else:
+            print(f"Unexpected response type: {type(result)}")
+
         print()
 
 if __name__ == "__main__":
     print("Note: Make sure you have set your OPENAI_API_KEY environment variable")
     print("Note: Make sure the NestJS API is running on port 3000")
     print()
-    
-    test_basic_queries()
+
+    asyncio.run(test_basic_queries())
@@ -0,0 +1,5 @@
+-- ANN index for KB retrieval; without it the `ORDER BY embedding <-> ...`
+-- in kb_agent falls back to a full sequential scan of documents.
+CREATE INDEX IF NOT EXISTS documents_embedding_idx
+	ON documents USING hnsw (embedding vector_l2_ops)
+	WITH (m = 16, ef_construction = 64);
@@ -0,0 +1,12 @@
+-- Semantic cache of KB answers keyed by query embedding; paraphrases within
+-- the distance threshold reuse the stored answer without a document search.
+CREATE TABLE IF NOT EXISTS query_cache (
+	id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+	embedding vector(1536),
+	answer JSONB NOT NULL,
+	hits INT DEFAULT 0,
+	created_at TIMESTAMPTZ DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS query_cache_embedding_idx
+	ON query_cache USING ivfflat (embedding vector_l2_ops) WITH (lists = 100);